@@ -0,0 +1,155 @@
+"""
+Run the benchmark suite or compare two of its result files.
+
+    python -m benchmarks run -o before.json
+    python -m benchmarks run -o after.json
+    python -m benchmarks compare before.json after.json
+"""
+import argparse
+import fnmatch
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+from typing import Any, Dict, List, Optional
+
+from .cases import CASES, SIZES
+
+FORMAT_VERSION = 1
+
+
+def run_case(name: str, repeat: int, min_time: float) -> Dict[str, Any]:
+    func = CASES[name]()
+    timer = timeit.Timer(func)
+    # Find a loop count that makes a single measurement last long enough.
+    number, _ = timer.autorange()
+    number = max(number, int(number * min_time / 0.2))
+    timings = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "loops": number,
+        "best": min(timings),
+        "median": statistics.median(timings),
+        "timings": timings,
+    }
+
+
+def run(args: argparse.Namespace) -> int:
+    def selected(name: str) -> bool:
+        return not args.filter or any(fnmatch.fnmatch(name, p) for p in args.filter)
+
+    results: Dict[str, Any] = {}
+    for name in filter(selected, CASES):
+        results[name] = run_case(name, args.repeat, args.min_time)
+        print(f"{name:<40} {results[name]['best'] * 1e6:>12.3f} us", file=sys.stderr)
+    sizes: Dict[str, int] = {}
+    for name in filter(selected, SIZES):
+        sizes[name] = SIZES[name]()
+        print(f"{name:<40} {sizes[name]:>12} B", file=sys.stderr)
+
+    report = {
+        "version": FORMAT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+        "sizes": sizes,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+    return 0
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        report = json.load(f)
+    if report.get("version") != FORMAT_VERSION:
+        raise SystemExit(f"{path}: unsupported result format {report.get('version')!r}")
+    return report
+
+
+def compare(args: argparse.Namespace) -> int:
+    base_report, head_report = load_report(args.base), load_report(args.head)
+    base, head = base_report["results"], head_report["results"]
+    regressions: List[str] = []
+    for name in sorted(base.keys() & head.keys()):
+        before, after = base[name][args.metric], head[name][args.metric]
+        ratio = after / before
+        if ratio > 1 + args.threshold:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 - args.threshold:
+            status = "improvement"
+        else:
+            status = ""
+        print(
+            f"{name:<40} {before * 1e6:>10.3f} us {after * 1e6:>10.3f} us"
+            f" {ratio:>7.2f}x  {status}",
+        )
+    for name in sorted(base.keys() ^ head.keys()):
+        print(f"{name:<40} only in {args.base if name in base else args.head}")
+
+    base_sizes, head_sizes = base_report.get("sizes", {}), head_report.get("sizes", {})
+    for name in sorted(base_sizes.keys() & head_sizes.keys()):
+        before, after = base_sizes[name], head_sizes[name]
+        status = ""
+        if after > before * (1 + args.threshold):
+            status = "REGRESSION"
+            regressions.append(name)
+        print(
+            f"{name:<40} {before:>10} B  {after:>10} B  {after / before:>7.2f}x  {status}"
+        )
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmark suite")
+    run_parser.add_argument("-o", "--output", help="write JSON results to a file")
+    run_parser.add_argument(
+        "-k",
+        "--filter",
+        action="append",
+        help="only run cases matching this glob pattern (repeatable)",
+    )
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="minimal duration of a single measurement in seconds",
+    )
+    run_parser.set_defaults(func=run)
+
+    compare_parser = subparsers.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("head")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as a regression (default: 0.1)",
+    )
+    compare_parser.add_argument(
+        "--metric",
+        choices=("best", "median"),
+        default="best",
+    )
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+import pickle
+from typing import Callable, Dict, List, Tuple, Type
+
+from pyjdb import BaseModel, Boolean, Embedded, Float, Integer, String
+from pyjdb.errors import ValidationError
+from pyjdb.fields import ModelField
+from pyjdb.models import pack_models, unpack_models
+
+# A benchmark case is a function that does its setup and returns the
+# zero-argument callable to be timed.
+Case = Callable[[], Callable[[], object]]
+
+CASES: Dict[str, Case] = {}
+# Size measurements (in bytes) reported next to the timings.
+SIZES: Dict[str, Callable[[], int]] = {}
+
+
+def case(name: str) -> Callable[[Case], Case]:
+    def decorator(func: Case) -> Case:
+        if name in CASES:
+            raise ValueError(f"duplicate benchmark case {name!r}")
+        CASES[name] = func
+        return func
+
+    return decorator
+
+
+def size(name: str) -> Callable[[Callable[[], int]], Callable[[], int]]:
+    def decorator(func: Callable[[], int]) -> Callable[[], int]:
+        if name in SIZES:
+            raise ValueError(f"duplicate size measurement {name!r}")
+        SIZES[name] = func
+        return func
+
+    return decorator
+
+
+class Narrow(BaseModel):
+    s = String()
+    b = Boolean()
+    i = Integer()
+    f = Float()
+
+
+class NarrowNoAssignmentValidation(Narrow, validate_assignment=False):
+    pass
+
+
+class NarrowFrozen(Narrow, frozen=True):
+    pass
+
+
+NARROW_PAYLOAD = {"s": "pygrammer", "b": True, "i": 18, "f": 4.0}
+NARROW_INVALID_PAYLOAD = {"s": "", "b": "maybe", "i": "eighteen", "f": None}
+
+WIDE_FIELD_COUNT = 40
+
+
+def _wide_model() -> Tuple[Type[BaseModel], Dict[str, object]]:
+    namespace: Dict[str, object] = {"__module__": __name__, "__qualname__": "Wide"}
+    payload: Dict[str, object] = {}
+    factories = (
+        (String, "value"),
+        (Boolean, False),
+        (Integer, 42),
+        (Float, 3.14),
+    )
+    for index in range(WIDE_FIELD_COUNT):
+        field_class, value = factories[index % len(factories)]
+        namespace[f"field_{index}"] = field_class()
+        payload[f"field_{index}"] = value
+    return type("Wide", (BaseModel,), namespace), payload
+
+
+Wide, WIDE_PAYLOAD = _wide_model()
+WIDE_INVALID_PAYLOAD = {key: None for key in WIDE_PAYLOAD}
+
+# A valid sample value for each 'String(fmt=...)' format.
+FORMAT_SAMPLES = {
+    None: "pygrammer",
+    "date": "2022-07-01",
+    "time": "12:30:00",
+    "datetime": "2022-07-01T12:30:00",
+    "uuid": "6b1d8e4e-5f55-4b4c-9e2a-5f3c1d2b7a90",
+    "email": "IHosseini@pm.me",
+    "ipaddress": "127.0.0.1",
+    "url": "https://github.com/IHosseini083/PyJDB",
+}
+
+FIELD_SAMPLES: List[Tuple[str, ModelField, object]] = [
+    *(
+        (f"string[{fmt}]", String(fmt=fmt), value)
+        for fmt, value in FORMAT_SAMPLES.items()
+    ),
+    ("boolean", Boolean(), True),
+    ("integer", Integer(), 18),
+    ("float", Float(), 4.0),
+    ("embedded", Embedded(Narrow), NARROW_PAYLOAD),
+]
+
+
+def _expect_invalid(model: Type[BaseModel], payload: Dict[str, object]) -> None:
+    try:
+        model(**payload)
+    except ValidationError:
+        pass
+    else:  # pragma: no cover - the payload is broken on purpose
+        raise AssertionError(f"{payload!r} unexpectedly passed validation")
+
+
+@case("construct.narrow.valid")
+def construct_narrow_valid() -> Callable[[], object]:
+    return lambda: Narrow(**NARROW_PAYLOAD)
+
+
+@case("construct.narrow.invalid")
+def construct_narrow_invalid() -> Callable[[], object]:
+    return lambda: _expect_invalid(Narrow, NARROW_INVALID_PAYLOAD)
+
+
+@case("construct.wide.valid")
+def construct_wide_valid() -> Callable[[], object]:
+    return lambda: Wide(**WIDE_PAYLOAD)
+
+
+@case("construct.wide.invalid")
+def construct_wide_invalid() -> Callable[[], object]:
+    return lambda: _expect_invalid(Wide, WIDE_INVALID_PAYLOAD)
+
+
+def _register_field_cases() -> None:
+    for label, field, value in FIELD_SAMPLES:
+        namespace = {"__module__": __name__, "__qualname__": "Single", "value": field}
+        model = type("Single", (BaseModel,), namespace)
+
+        def construct(model=model, value=value) -> Callable[[], object]:
+            return lambda: model(value=value)
+
+        case(f"construct.field.{label}")(construct)
+
+
+_register_field_cases()
+
+
+def _register_partial_cases() -> None:
+    names = list(WIDE_PAYLOAD)
+    for count in (3, 10, 20, WIDE_FIELD_COUNT):
+
+        def partial(only=tuple(names[:count])) -> Callable[[], object]:
+            return lambda: Wide.partial(WIDE_PAYLOAD, only=only)
+
+        case(f"construct.partial.wide.{count}of{WIDE_FIELD_COUNT}")(partial)
+
+
+_register_partial_cases()
+
+
+@case("assign.validated")
+def assign_validated() -> Callable[[], object]:
+    model = Narrow(**NARROW_PAYLOAD)
+
+    def assign() -> None:
+        model.i = 21
+
+    return assign
+
+
+@case("assign.unvalidated")
+def assign_unvalidated() -> Callable[[], object]:
+    model = NarrowNoAssignmentValidation(**NARROW_PAYLOAD)
+
+    def assign() -> None:
+        model.i = 21
+
+    return assign
+
+
+@case("assign.update.wide")
+def assign_update_wide() -> Callable[[], object]:
+    model = Wide(**WIDE_PAYLOAD)
+    changes = {f"field_{index}": 7 for index in range(2, 22, 4)}
+    return lambda: model.update(**changes)
+
+
+@case("copy.update.wide")
+def copy_update_wide() -> Callable[[], object]:
+    model = Wide(**WIDE_PAYLOAD)
+    changes = {f"field_{index}": 7 for index in range(2, 22, 4)}
+    return lambda: model.copy(update=changes)
+
+
+@case("copy.update.frozen")
+def copy_update_frozen() -> Callable[[], object]:
+    model = NarrowFrozen(**NARROW_PAYLOAD)
+    return lambda: model.copy(update={"i": 21})
+
+
+@case("access.attribute")
+def access_attribute() -> Callable[[], object]:
+    model = Narrow(**NARROW_PAYLOAD)
+    return lambda: model.i
+
+
+@case("access.item")
+def access_item() -> Callable[[], object]:
+    model = Narrow(**NARROW_PAYLOAD)
+    return lambda: model["i"]
+
+
+@case("hash.frozen")
+def hash_frozen() -> Callable[[], object]:
+    model = NarrowFrozen(**NARROW_PAYLOAD)
+    return lambda: hash(model)
+
+
+@case("repr.narrow")
+def repr_narrow() -> Callable[[], object]:
+    model = Narrow(**NARROW_PAYLOAD)
+    return lambda: repr(model)
+
+
+@case("repr.wide")
+def repr_wide() -> Callable[[], object]:
+    model = Wide(**WIDE_PAYLOAD)
+    return lambda: repr(model)
+
+
+@case("mapping.dict.narrow")
+def mapping_dict_narrow() -> Callable[[], object]:
+    model = Narrow(**NARROW_PAYLOAD)
+    return lambda: dict(model)
+
+
+@case("mapping.dict.wide")
+def mapping_dict_wide() -> Callable[[], object]:
+    model = Wide(**WIDE_PAYLOAD)
+    return lambda: dict(model)
+
+
+@case("mapping.items.wide")
+def mapping_items_wide() -> Callable[[], object]:
+    model = Wide(**WIDE_PAYLOAD)
+    return lambda: list(model.items())
+
+
+BATCH_SIZE = 1000
+
+
+def _narrow_batch() -> List[BaseModel]:
+    return [Narrow(**{**NARROW_PAYLOAD, "i": i}) for i in range(BATCH_SIZE)]
+
+
+@case("pickle.roundtrip.narrow")
+def pickle_roundtrip_narrow() -> Callable[[], object]:
+    model = Narrow(**NARROW_PAYLOAD)
+    return lambda: pickle.loads(pickle.dumps(model))
+
+
+@case("pickle.roundtrip.wide")
+def pickle_roundtrip_wide() -> Callable[[], object]:
+    model = Wide(**WIDE_PAYLOAD)
+    return lambda: pickle.loads(pickle.dumps(model))
+
+
+@case("pickle.roundtrip.list")
+def pickle_roundtrip_list() -> Callable[[], object]:
+    models = _narrow_batch()
+    return lambda: pickle.loads(pickle.dumps(models))
+
+
+@case("pickle.roundtrip.packed")
+def pickle_roundtrip_packed() -> Callable[[], object]:
+    models = _narrow_batch()
+    return lambda: unpack_models(
+        pickle.loads(pickle.dumps(pack_models(Narrow, models)))
+    )
+
+
+@size("pickle.narrow")
+def pickle_size_narrow() -> int:
+    return len(pickle.dumps(Narrow(**NARROW_PAYLOAD)))
+
+
+@size("pickle.wide")
+def pickle_size_wide() -> int:
+    return len(pickle.dumps(Wide(**WIDE_PAYLOAD)))
+
+
+@size("pickle.list")
+def pickle_size_list() -> int:
+    return len(pickle.dumps(_narrow_batch()))
+
+
+@size("pickle.packed")
+def pickle_size_packed() -> int:
+    return len(pickle.dumps(pack_models(Narrow, _narrow_batch())))
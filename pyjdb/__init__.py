@@ -1,5 +1,5 @@
 from .config import BaseConfig
-from .fields import Boolean, Float, Integer, String
+from .fields import Boolean, Embedded, Float, Integer, String
 from .models import BaseModel
 
 __version__ = "0.1.0"
@@ -10,4 +10,5 @@ __all__ = [
     "BaseConfig",
     "Integer",
     "Float",
+    "Embedded",
 ]
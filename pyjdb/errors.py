@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any, Iterable, List, Tuple, Union, cast
 
 if TYPE_CHECKING:
@@ -13,6 +14,11 @@ __all__ = [
     "parse_typesystem_validation_error",
     "FrozenFieldError",
     "FieldNotFoundError",
+    "ModelTypeError",
+    "FieldNotLoadedError",
+    "EmbeddedNotFrozenError",
+    "IncompatibleStateError",
+    "FieldSelectionTypeError",
 ]
 
 
@@ -57,6 +63,16 @@ class FrozenFieldError(PyJDBTypeError):
         super().__init__(name=name)
 
 
+class EmbeddedNotFrozenError(PyJDBTypeError):
+    msg_template = (
+        "Field {name!r} embeds {embedded!r} which is not frozen, "
+        "frozen models can only embed frozen models."
+    )
+
+    def __init__(self, *, name: str, embedded: str) -> None:
+        super().__init__(name=name, embedded=embedded)
+
+
 class FieldNotFoundError(PyJDBValueError):
     msg_template = "Model {ob_name!r} has no field {field_name!r}"
 
@@ -64,6 +80,40 @@ class FieldNotFoundError(PyJDBValueError):
         super().__init__(ob_name=ob_name, field_name=field_name)
 
 
+class FieldNotLoadedError(PyJDBValueError):
+    msg_template = (
+        "Field {field_name!r} of {ob_name!r} was not loaded, "
+        "add it to 'only' or remove it from 'exclude' to access it."
+    )
+
+    def __init__(self, *, ob_name: str, field_name: str) -> None:
+        super().__init__(ob_name=ob_name, field_name=field_name)
+
+
+class IncompatibleStateError(PyJDBValueError):
+    msg_template = (
+        "Can't restore {ob_name!r} from a state created for different fields, "
+        "the model has changed since the state was pickled."
+    )
+
+    def __init__(self, *, ob_name: str) -> None:
+        super().__init__(ob_name=ob_name)
+
+
+class FieldSelectionTypeError(PyJDBTypeError):
+    msg_template = "{arg!r} must be an iterable of field names, not a str {value!r}"
+
+    def __init__(self, *, arg: str, value: str) -> None:
+        super().__init__(arg=arg, value=value)
+
+
+class ModelTypeError(PyJDBTypeError):
+    msg_template = "Expected an instance of {expected!r}, got {found!r}"
+
+    def __init__(self, *, expected: str, found: str) -> None:
+        super().__init__(expected=expected, found=found)
+
+
 class ValidationError(PyJDBValueError):
     msg_template = "  |-- {name!r}: <{value!r}> -> {message}"
 
@@ -90,9 +140,26 @@ def parse_typesystem_validation_error(
 ) -> "ValidationError":
     if isinstance(context, tuple):  # if the context is passed as a FieldValue
         context = cast("FieldValue", context)
-        errors = [(context.name, context.value, next(iter(err.values())))]
+        # Errors of nested models are reported with their dotted path
+        # relative to the assigned field, e.g. 'address.city'.
+        prefix: List[Union[int, str]] = [context.name]
+        context = {context.name: context.value}
     else:
+        prefix = []
+    errors = []
+    for message in err.messages():
+        index = prefix + message.index
+        errors.append(
+            (".".join(map(str, index)), _lookup(context, index), message.text),
+        )
+    return ValidationError(errors=errors)
+
+
+def _lookup(context: Any, index: List[Union[int, str]]) -> Any:
+    for key in index:
         # Use 'Mapping.get' method to prevent KeyError in case
         # the field is required but user did not pass a value.
-        errors = [(name, context.get(name), message) for name, message in err.items()]
-    return ValidationError(errors=errors)
+        if not isinstance(context, Mapping):
+            return None
+        context = context.get(key)
+    return context
@@ -15,6 +15,7 @@ from typing import (
 import typesystem
 
 from .errors import (
+    FieldNotLoadedError,
     FrozenFieldError,
     InvalidFormatError,
     parse_typesystem_validation_error,
@@ -23,13 +24,14 @@ from .types import FieldValue
 
 if TYPE_CHECKING:
     from .models import BaseModel
-    from .typings import IntOrFloat, SetStr
+    from .typings import DictStrAny, IntOrFloat, SetStr
 
     from typing_extensions import Self
 
 from .utils import Repr
 
 _T = TypeVar("_T")
+_M = TypeVar("_M", bound="BaseModel")
 
 __all__ = [
     "ModelField",
@@ -37,6 +39,7 @@ __all__ = [
     "Boolean",
     "Integer",
     "Float",
+    "Embedded",
 ]
 
 
@@ -113,25 +116,41 @@ class ModelField(Repr, Generic[_T], ABC):
         if inst is None:
             # if accessed from directly from the model, return the field itself.
             return self
-        return inst.__data__[self.name]
+        try:
+            return inst.__data__[self.name]
+        except KeyError:
+            if self.name in inst.__unloaded__:
+                raise FieldNotLoadedError(
+                    ob_name=inst.__repr_name__(),
+                    field_name=self.name,
+                ) from None
+            raise
 
     def __set__(self, inst: "BaseModel", value: _T) -> None:
         if inst.__config__.frozen:
             raise FrozenFieldError(name=self.name)
         if not inst.__config__.validate_assignment:
             inst.__data__[self.name] = value
-            return
-
-        try:
-            inst.__data__[self.name] = self.validator.validate(value)
-        except typesystem.ValidationError as e:
-            raise parse_typesystem_validation_error(
-                e,
-                FieldValue(name=self.name, value=value),
-            ) from None
+        else:
+            try:
+                inst.__data__[self.name] = self.validator.validate(value)
+            except typesystem.ValidationError as e:
+                raise parse_typesystem_validation_error(
+                    e,
+                    FieldValue(name=self.name, value=value),
+                ) from None
+        inst.__changed__.add(self.name)
+        if inst.__unloaded__:
+            inst.__mark_loaded__((self.name,))
 
     def __delete__(self, inst: "BaseModel") -> None:
-        del inst.__data__[self.name]
+        if self.name in inst.__unloaded__:
+            # Deleting an unloaded field makes it a regular missing field.
+            inst.__data__.pop(self.name, None)
+            inst.__mark_loaded__((self.name,))
+        else:
+            del inst.__data__[self.name]
+        inst.__changed__.add(self.name)
 
 
 class String(ModelField[str]):
@@ -232,3 +251,49 @@ class Integer(Number):
 class Float(Number):
     def get_validator(self, **kwargs) -> typesystem.Field:
         return typesystem.Float(**kwargs)
+
+
+class ModelValidator(typesystem.Field):
+    """Validate a sub-document against a model's schema and convert it to the model."""
+
+    errors = {"null": "May not be null."}
+
+    def __init__(self, *, to: Type["BaseModel"], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.to = to
+
+    def validate(self, value: Any) -> Any:
+        if value is None and self.allow_null:
+            return None
+        elif value is None:
+            raise self.validation_error("null")
+        elif isinstance(value, self.to) and not value.__unloaded__:
+            # Already a validated instance of the model, copy it without validation
+            # so that the caller's instance is never shared with (or between) parents.
+            # Partial instances are validated again as they may lack required fields.
+            return value.copy()
+        return self.to.__construct__(self.to.__validate__(value))
+
+    def get_default_value(self) -> Any:
+        # Build (or copy) a new instance from the default for every model using it.
+        return self.validate(super().get_default_value())
+
+
+class Embedded(ModelField[_M]):
+    def __init__(
+        self,
+        to: Type[_M],
+        *,
+        default: Union[_M, "DictStrAny"] = Undefined,  # type: ignore
+        nullable: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(
+            to=to,
+            default=default,
+            allow_null=nullable,
+            **kwargs,
+        )
+
+    def get_validator(self, **kwargs) -> typesystem.Field:
+        return ModelValidator(**kwargs)
@@ -1,16 +1,24 @@
+import zlib
 from abc import ABCMeta
 from collections.abc import Mapping
 from copy import deepcopy
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    FrozenSet,
+    Iterable,
     Iterator,
+    List,
+    NamedTuple,
     NoReturn,
     Optional,
+    Sequence,
     Tuple,
     Type,
+    TypeVar,
     no_type_check,
 )
 
@@ -19,19 +27,35 @@ import typesystem
 from .config import BaseConfig, inherit_config
 from .errors import (
     DuplicateConfigError,
+    EmbeddedNotFrozenError,
     FieldNotFoundError,
+    FieldNotLoadedError,
+    FieldSelectionTypeError,
+    FrozenFieldError,
+    IncompatibleStateError,
+    ModelTypeError,
+    ValidationError,
     parse_typesystem_validation_error,
 )
-from .fields import ModelField
+from .fields import Embedded, ModelField, Undefined
+from .types import FieldValue
 from .utils import Repr
 
 if TYPE_CHECKING:
-    from .typings import DictStrAny, ReprArgs
+    from .typings import DictStrAny, ModelState, ReprArgs, SetStr
+
+    PackedModels = Tuple[Type["BaseModel"], int, List[ModelState]]
 
 _FIELDS_KEY = "__fields__"
 _COLLECTION_KEY = "__collection__"
 _SCHEMA_KEY = "__schema__"
 _CONFIG_KEY = "__config__"
+_EMBEDDED_KEY = "__embedded__"
+_FINGERPRINT_KEY = "__fingerprint__"
+
+_M = TypeVar("_M", bound="BaseModel")
+
+_NOTHING_UNLOADED: FrozenSet[str] = frozenset()
 
 
 def iter_fields(namespace: "DictStrAny") -> Iterator[Tuple[str, ModelField]]:
@@ -40,22 +64,97 @@ def iter_fields(namespace: "DictStrAny") -> Iterator[Tuple[str, ModelField]]:
             yield name, value
 
 
+def validate_data(
+    data: Mapping,
+    schema: typesystem.Schema,
+    fields: Dict[str, ModelField],
+) -> "DictStrAny":
+    validated = schema.validate(data)
+    for key, value in fields.items():
+        if value.validator.read_only and value.validator.has_default():
+            validated[key] = value.validator.get_default_value()
+    return validated
+
+
 def validate_kwargs(
     kwargs: "DictStrAny",
     schema: typesystem.Schema,
     fields: Dict[str, ModelField],
 ) -> "DictStrAny":
     try:
-        kwargs = schema.validate(kwargs)
+        return validate_data(kwargs, schema, fields)
     except typesystem.ValidationError as e:
         raise parse_typesystem_validation_error(
             e,
             kwargs,
         ) from None
-    for key, value in fields.items():
-        if value.validator.read_only and value.validator.has_default():
-            kwargs[key] = value.validator.get_default_value()
-    return kwargs
+
+
+def check_field_names(names: Iterable[str], model: Type["BaseModel"]) -> None:
+    for name in names:
+        if name not in model.__fields__:
+            raise FieldNotFoundError(ob_name=model.__name__, field_name=name)
+
+
+def validate_changes(
+    changes: "DictStrAny",
+    model: Type["BaseModel"],
+) -> "DictStrAny":
+    """Validate the given field values as one batch, reporting all errors at once."""
+    check_field_names(changes, model)
+    validated = {}
+    errors = []
+    for name, value in changes.items():
+        try:
+            validated[name] = model.__fields__[name].validator.validate(value)
+        except typesystem.ValidationError as e:
+            error = parse_typesystem_validation_error(e, FieldValue(name, value))
+            errors.extend(error.errors)
+    if errors:
+        raise ValidationError(errors=errors)
+    return validated
+
+
+class PartialSelection(NamedTuple):
+    names: Tuple[str, ...]
+    fields: Dict[str, ModelField]
+    schema: typesystem.Schema
+    unloaded: FrozenSet[str]
+
+
+@lru_cache(maxsize=256)
+def select_fields(
+    model: Type["BaseModel"],
+    only: Optional[Tuple[str, ...]],
+    exclude: Tuple[str, ...],
+) -> PartialSelection:
+    """Select the fields to load for 'BaseModel.partial', in their declared order."""
+    check_field_names(only or (), model)
+    check_field_names(exclude, model)
+    selected = model.__fields__.keys() if only is None else set(only)
+    names = tuple(
+        name for name in model.__fields__ if name in selected and name not in exclude
+    )
+    fields = {name: model.__fields__[name] for name in names}
+    return PartialSelection(
+        names=names,
+        fields=fields,
+        schema=typesystem.Schema(fields={k: v.validator for k, v in fields.items()}),
+        unloaded=frozenset(model.__fields__).difference(names),
+    )
+
+
+def schema_fingerprint(fields: Dict[str, ModelField]) -> int:
+    """
+    Return a short fingerprint of the names and types of the fields, in order.
+
+    Unlike 'hash', it's stable across processes, so it can be used to check that
+    a pickled state was created for the same fields.
+    """
+    layout = ";".join(
+        f"{name}:{type(field).__name__}" for name, field in fields.items()
+    )
+    return zlib.crc32(layout.encode())
 
 
 class ModelMeta(ABCMeta):
@@ -90,6 +189,17 @@ class ModelMeta(ABCMeta):
         # Inherit the user-defined Config attribute.
         config = inherit_config(config_from_namespace, config, **config_kwargs)
 
+        # A frozen model is hashed by its values, so its embedded models
+        # must be frozen (hashable) as well.
+        embedded = tuple(
+            name for name, field in fields.items() if isinstance(field, Embedded)
+        )
+        if config.frozen:
+            for field_name in embedded:
+                to = fields[field_name].validator.to
+                if not to.__config__.frozen:
+                    raise EmbeddedNotFrozenError(name=field_name, embedded=to.__name__)
+
         # Generate the schema from fields
         schema = typesystem.Schema(fields={k: v.validator for k, v in fields.items()})
 
@@ -112,6 +222,8 @@ class ModelMeta(ABCMeta):
             _COLLECTION_KEY: collection,
             _SCHEMA_KEY: schema,
             _CONFIG_KEY: config,
+            _EMBEDDED_KEY: embedded,
+            _FINGERPRINT_KEY: schema_fingerprint(fields),
             "__hash__": hash_function,
             **namespace,
         }
@@ -142,14 +254,186 @@ class BaseModel(Repr, Mapping[str, Any], metaclass=ModelMeta):
         __collection__: str
         __schema__: typesystem.Schema
         __data__: "DictStrAny"
+        __changed__: "SetStr"
+        # Fields not loaded by 'BaseModel.partial', empty for other instances.
+        __unloaded__: FrozenSet[str]
         __config__: Type[BaseConfig]
+        # Names of the 'Embedded' fields.
+        __embedded__: Tuple[str, ...]
+        __fingerprint__: int
 
     Config = BaseConfig
-    __slots__ = ("__data__",)
+    __slots__ = ("__data__", "__changed__", "__unloaded__")
 
     def __init__(self, **data: Any) -> None:
         validated_kwargs = validate_kwargs(data, self.__schema__, self.__fields__)
         object_setattr(self, "__data__", validated_kwargs)
+        object_setattr(self, "__changed__", set())
+        object_setattr(self, "__unloaded__", _NOTHING_UNLOADED)
+
+    @classmethod
+    def __validate__(cls, data: Mapping) -> "DictStrAny":
+        """Validate raw data against the model schema, raising typesystem errors."""
+        return validate_data(data, cls.__schema__, cls.__fields__)
+
+    @classmethod
+    def __construct__(cls: Type[_M], data: "DictStrAny") -> _M:
+        """Create an instance from already validated data, skipping validation."""
+        inst = cls.__new__(cls)
+        object_setattr(inst, "__data__", data)
+        object_setattr(inst, "__changed__", set())
+        object_setattr(inst, "__unloaded__", _NOTHING_UNLOADED)
+        return inst
+
+    def update(self, **changes: Any) -> None:
+        """
+        Assign several fields at once.
+
+        Changed values are validated together (if 'validate_assignment' is enabled)
+        and either all of them are applied or, on error, none of them.
+        """
+        if not changes:
+            return
+        if self.__config__.frozen:
+            raise FrozenFieldError(name=next(iter(changes)))
+        if self.__config__.validate_assignment:
+            changes = validate_changes(changes, self.__class__)
+        else:
+            check_field_names(changes, self.__class__)
+        self.__data__.update(changes)
+        self.__changed__.update(changes)
+        if self.__unloaded__:
+            self.__mark_loaded__(changes)
+
+    def copy(self: _M, *, update: Optional["DictStrAny"] = None) -> _M:
+        """
+        Return a shallow copy of the model, optionally with some fields changed.
+
+        Unchanged values are shared with the original and aren't validated again,
+        the values in 'update' are validated like in 'update()', i.e. only if
+        'validate_assignment' is enabled. Embedded models are copied the same way
+        so the copy never shares a mutable sub-model. Works for frozen models too.
+        """
+        data = self.__data__.copy()
+        if update:
+            if self.__config__.validate_assignment:
+                update = validate_changes(update, self.__class__)
+            else:
+                check_field_names(update, self.__class__)
+            data.update(update)
+        inst = self.__construct__(data)
+        for name, value in inst.__iter_embedded__():
+            data[name] = value.copy()
+        inst.__changed__.update(self.__changed__, update or ())
+        object_setattr(inst, "__unloaded__", self.__unloaded__)
+        if update and inst.__unloaded__:
+            inst.__mark_loaded__(update)
+        return inst
+
+    def __mark_loaded__(self, names: Iterable[str]) -> None:
+        """Stop treating the given fields as unloaded, e.g. after assigning them."""
+        object_setattr(self, "__unloaded__", self.__unloaded__.difference(names))
+
+    @classmethod
+    def partial(
+        cls: Type[_M],
+        data: Mapping,
+        *,
+        only: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> _M:
+        """
+        Load only some of the fields from raw data (e.g. a stored record).
+
+        Only the selected fields are extracted from 'data' and validated, accessing
+        any other field of the returned instance raises 'FieldNotLoadedError'.
+        """
+        for arg, value in (("only", only), ("exclude", exclude)):
+            if isinstance(value, str):
+                raise FieldSelectionTypeError(arg=arg, value=value)
+        selection = select_fields(
+            cls,
+            None if only is None else tuple(only),
+            tuple(exclude or ()),
+        )
+        data = {name: data[name] for name in selection.names if name in data}
+        validated = validate_kwargs(data, selection.schema, selection.fields)
+        inst = cls.__construct__(validated)
+        object_setattr(inst, "__unloaded__", selection.unloaded)
+        return inst
+
+    @property
+    def changed_fields(self) -> FrozenSet[str]:
+        """
+        Names of the fields assigned or deleted since the model was loaded/saved.
+
+        Embedded fields whose model has changed fields are included too.
+        """
+        changed = set(self.__changed__)
+        for name, value in self.__iter_embedded__():
+            if name not in changed and value.changed_fields:
+                changed.add(name)
+        return frozenset(changed)
+
+    def clear_changed_fields(self) -> None:
+        """Mark the current field values as persisted, e.g. after saving the model."""
+        self.__changed__.clear()
+        for _, value in self.__iter_embedded__():
+            value.clear_changed_fields()
+
+    def __iter_embedded__(self) -> Iterator[Tuple[str, "BaseModel"]]:
+        """Yield the name and value of the embedded fields holding a model."""
+        data = self.__data__
+        for name in self.__embedded__:
+            value = data.get(name)
+            # Anything can be assigned if 'validate_assignment' is disabled.
+            if isinstance(value, BaseModel):
+                yield name, value
+
+    def __getstate__(self) -> "ModelState":
+        """
+        Return the schema fingerprint, the field values as a tuple in declared order
+        and the changed fields.
+
+        Missing values are stored as 'Undefined' to keep the values positional,
+        the model class and its schema are never part of the state. Partial models
+        also store their unloaded fields.
+        """
+        return (self.__fingerprint__, *self.__dump_state__())
+
+    def __setstate__(self, state: "ModelState") -> None:
+        fingerprint, *fields_state = state
+        if fingerprint != self.__fingerprint__:
+            raise IncompatibleStateError(ob_name=self.__repr_name__())
+        self.__load_state__(fields_state)
+
+    def __dump_state__(self) -> "ModelState":
+        fields, changed = self.__fields__, self.__changed__
+        values = tuple(self.__data__.get(name, Undefined) for name in fields)
+        state = values, tuple(name for name in fields if name in changed)
+        unloaded = self.__unloaded__
+        if unloaded:
+            return (*state, tuple(name for name in fields if name in unloaded))
+        return state
+
+    def __load_state__(self, state: Sequence[Any]) -> None:
+        # The state comes from '__dump_state__' so it's trusted and not validated,
+        # but it must still match the fields of this model positionally.
+        values, changed, *unloaded = state
+        if len(values) != len(self.__fields__):
+            raise IncompatibleStateError(ob_name=self.__repr_name__())
+        data = {
+            name: value
+            for name, value in zip(self.__fields__, values)
+            if value is not Undefined
+        }
+        object_setattr(self, "__data__", data)
+        object_setattr(self, "__changed__", set(changed))
+        object_setattr(
+            self,
+            "__unloaded__",
+            frozenset(unloaded[0]) if unloaded else _NOTHING_UNLOADED,
+        )
 
     def __repr_args__(self) -> "ReprArgs":
         return [(k, v) for k, v in self.__data__.items() if self.__fields__[k].repr_]
@@ -163,6 +447,11 @@ class BaseModel(Repr, Mapping[str, Any], metaclass=ModelMeta):
             return value
 
     def __missing__(self, __key: str) -> NoReturn:
+        if __key in self.__unloaded__:
+            raise FieldNotLoadedError(
+                ob_name=self.__repr_name__(),
+                field_name=__key,
+            ) from None
         raise FieldNotFoundError(
             ob_name=self.__repr_name__(),
             field_name=__key,
@@ -180,8 +469,39 @@ class BaseModel(Repr, Mapping[str, Any], metaclass=ModelMeta):
     def get(self, key: str, default: Any = None, /) -> Any:
         try:
             return self[key]
-        except FieldNotFoundError:
+        except (FieldNotFoundError, FieldNotLoadedError):
             return default
 
     def __bool__(self) -> bool:
         return bool(self.__data__)
+
+
+def pack_models(model: Type[_M], instances: Iterable[_M]) -> "PackedModels":
+    """
+    Pack instances of a single model into a compact, picklable form.
+
+    The model class and its schema fingerprint are stored once for the whole
+    batch instead of once per instance.
+    """
+    states = []
+    for inst in instances:
+        if inst.__class__ is not model:
+            raise ModelTypeError(
+                expected=model.__name__,
+                found=inst.__class__.__name__,
+            )
+        states.append(inst.__dump_state__())
+    return model, model.__fingerprint__, states
+
+
+def unpack_models(packed: "PackedModels") -> List["BaseModel"]:
+    """Rebuild the instances packed by 'pack_models' without validating them again."""
+    model, fingerprint, states = packed
+    if fingerprint != model.__fingerprint__:
+        raise IncompatibleStateError(ob_name=model.__name__)
+    instances = []
+    for state in states:
+        inst = model.__new__(model)
+        inst.__load_state__(state)
+        instances.append(inst)
+    return instances
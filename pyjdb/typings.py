@@ -4,3 +4,4 @@ ReprArgs = List[Tuple[str, Any]]
 DictStrAny = Dict[str, Any]
 SetStr = Set[str]
 IntOrFloat = Union[int, float]
+ModelState = Tuple[Any, ...]
@@ -0,0 +1,190 @@
+import pytest
+
+from pyjdb import BaseModel, Embedded, Integer, String
+from pyjdb.errors import EmbeddedNotFrozenError, ValidationError
+
+
+class Address(BaseModel):
+    city = String()
+    zip_code = Integer(nullable=True)
+
+
+def test_sub_document_validation() -> None:
+    class User(BaseModel):
+        address = Embedded(Address)
+
+    u = User(address={"city": "  Tehran  ", "zip_code": "1234"})
+
+    assert isinstance(u.address, Address)
+    assert u.address.city == "Tehran"
+    assert u.address.zip_code == 1234
+
+    with pytest.raises(ValidationError) as exc_info:
+        User(address={"zip_code": "x"})
+
+    assert [name for name, *_ in exc_info.value.errors] == [
+        "address.city",
+        "address.zip_code",
+    ]
+
+    with pytest.raises(ValidationError):
+        User(address="Tehran")
+
+
+def test_model_instance() -> None:
+    class User(BaseModel):
+        address = Embedded(Address)
+
+    address = Address(city="Tehran")
+
+    # Instances of the embedded model are copied, not shared with the caller.
+    u = User(address=address)
+    assert u.address == address
+    assert u.address is not address
+
+    u.address.city = "Shiraz"  # type: ignore
+    assert address.city == "Tehran"
+
+    u.address = address
+    assert u.address is not address
+    u.update(address=address)
+    assert u.address is not address
+
+    # Unless they're partial instances.
+    with pytest.raises(ValidationError):
+        User(address=Address.partial({}, only=[]))
+
+    partial = Address.partial({"city": "Tehran"}, only=["city"])
+    assert User(address=partial).address == {"city": "Tehran", "zip_code": None}
+
+
+def test_assignment() -> None:
+    class User(BaseModel):
+        address = Embedded(Address)
+
+    u = User(address={"city": "Tehran"})
+    u.address = {"city": "Shiraz"}  # type: ignore
+    assert u.address.city == "Shiraz"
+
+    with pytest.raises(ValidationError) as exc_info:
+        u.address = {"city": ""}  # type: ignore
+
+    assert [name for name, *_ in exc_info.value.errors] == ["address.city"]
+
+
+def test_nullable() -> None:
+    class User(BaseModel):
+        address = Embedded(Address, nullable=True)
+
+    assert User().address is None
+
+    class User(BaseModel):  # type: ignore
+        address = Embedded(Address)
+
+    with pytest.raises(ValidationError):
+        User()
+
+
+def test_default_value() -> None:
+    class User(BaseModel):
+        address = Embedded(Address, default={"city": "Tehran"})
+
+    first, second = User(), User()
+
+    assert isinstance(first.address, Address)
+    assert first.address.city == "Tehran"
+    assert first.address is not second.address
+
+    default = Address(city="Tehran")
+
+    class User(BaseModel):  # type: ignore
+        address = Embedded(Address, default=default)
+
+    first, second = User(), User()
+
+    assert first.address == default
+    assert first.address is not default
+    assert first.address is not second.address
+
+    with pytest.raises(ValidationError):
+
+        class User(BaseModel):  # type: ignore
+            address = Embedded(Address, default={"city": ""})
+
+
+def test_changed_fields() -> None:
+    class User(BaseModel):
+        name = String()
+        address = Embedded(Address)
+        other = Embedded(Address, nullable=True)
+
+    u = User(name="pygrammer", address={"city": "Tehran"})
+    assert not u.changed_fields
+
+    u.address.city = "Shiraz"  # type: ignore
+    assert u.changed_fields == {"address"}
+    assert u.address.changed_fields == {"city"}
+
+    u.clear_changed_fields()
+    assert not u.changed_fields
+    assert not u.address.changed_fields
+
+
+def test_copy() -> None:
+    class User(BaseModel):
+        address = Embedded(Address)
+
+    address = Address(city="Tehran")
+    u = User(address={"city": "Tehran"})
+
+    copied = u.copy()
+    copied.address.city = "Shiraz"  # type: ignore
+    assert u.address.city == "Tehran"
+    assert not u.changed_fields
+
+    updated = u.copy(update={"address": address})
+    assert updated.address == address
+    assert updated.address is not address
+
+
+def test_frozen() -> None:
+    class FrozenAddress(BaseModel, frozen=True):
+        city = String()
+
+    class User(BaseModel, frozen=True):
+        address = Embedded(FrozenAddress)
+
+    assert hash(User(address={"city": "Tehran"})) == hash(
+        User(address={"city": "Tehran"}),
+    )
+
+    # Frozen models are hashed by their values, so they can't embed
+    # models that aren't frozen.
+    with pytest.raises(EmbeddedNotFrozenError):
+
+        class User(BaseModel, frozen=True):  # type: ignore
+            address = Embedded(Address)
+
+    class MutableUser(BaseModel):
+        address = Embedded(Address)
+
+    with pytest.raises(EmbeddedNotFrozenError):
+
+        class FrozenUser(MutableUser, frozen=True):
+            pass
+
+
+def test_without_assignment_validation() -> None:
+    class User(BaseModel, validate_assignment=False):
+        address = Embedded(Address)
+
+    u = User(address={"city": "Tehran"})
+    u.address = {"city": "Shiraz"}  # type: ignore
+    assert u.address == {"city": "Shiraz"}
+    assert u.changed_fields == {"address"}
+
+    u.clear_changed_fields()
+    assert not u.changed_fields
+
+    u.address = "Shiraz"  # type: ignore
+    assert u.copy().address == "Shiraz"
@@ -0,0 +1,125 @@
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from benchmarks.__main__ import FORMAT_VERSION, main
+
+
+def write_report(
+    path: Path,
+    results: Dict[str, float],
+    sizes: Optional[Dict[str, int]] = None,
+    version: int = FORMAT_VERSION,
+) -> str:
+    report = {
+        "version": version,
+        "results": {
+            name: {"best": best, "median": best * 2} for name, best in results.items()
+        },
+        "sizes": sizes or {},
+    }
+    path.write_text(json.dumps(report))
+    return str(path)
+
+
+def compare(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture,
+    base: Dict[str, float],
+    head: Dict[str, float],
+    *args: str,
+    base_sizes: Optional[Dict[str, int]] = None,
+    head_sizes: Optional[Dict[str, int]] = None,
+) -> Tuple[int, List[str]]:
+    """Run 'compare' and return its exit status and the flagged names."""
+    base_path = write_report(tmp_path / "base.json", base, base_sizes)
+    head_path = write_report(tmp_path / "head.json", head, head_sizes)
+    status = main(["compare", base_path, head_path, *args])
+    flagged = [
+        line.split()[0]
+        for line in capsys.readouterr().out.splitlines()
+        if line.endswith("REGRESSION")
+    ]
+    return status, flagged
+
+
+def test_no_regressions(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    status, flagged = compare(
+        tmp_path,
+        capsys,
+        {"a": 1.0, "b": 1.0},
+        # Slower within the threshold and faster.
+        {"a": 1.09, "b": 0.5},
+    )
+    assert status == 0
+    assert flagged == []
+
+
+def test_timing_regression(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    status, flagged = compare(
+        tmp_path,
+        capsys,
+        {"a": 1.0, "b": 1.0, "c": 1.0},
+        {"a": 1.2, "b": 1.05, "c": 2.0},
+    )
+    assert status == 1
+    assert flagged == ["a", "c"]
+
+
+def test_threshold(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    base, head = {"a": 1.0}, {"a": 1.2}
+
+    assert compare(tmp_path, capsys, base, head, "--threshold", "0.3") == (0, [])
+    assert compare(tmp_path, capsys, base, head, "--threshold", "0.1") == (1, ["a"])
+
+
+def test_metric(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    # 'median' is twice 'best' in both reports, so the ratio is the same.
+    status, flagged = compare(
+        tmp_path,
+        capsys,
+        {"a": 1.0},
+        {"a": 1.5},
+        "--metric",
+        "median",
+    )
+    assert status == 1
+    assert flagged == ["a"]
+
+
+def test_size_regression(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    status, flagged = compare(
+        tmp_path,
+        capsys,
+        {},
+        {},
+        base_sizes={"small": 100, "large": 100, "shrunk": 100},
+        head_sizes={"small": 105, "large": 200, "shrunk": 50},
+    )
+    assert status == 1
+    assert flagged == ["large"]
+
+
+def test_cases_only_in_one_run(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture,
+) -> None:
+    base_path = write_report(tmp_path / "base.json", {"a": 1.0, "old": 1.0})
+    head_path = write_report(tmp_path / "head.json", {"a": 1.0, "new": 100.0})
+
+    # Cases missing from one of the runs are reported but never flagged.
+    assert main(["compare", base_path, head_path]) == 0
+    out = capsys.readouterr().out
+    assert f"only in {base_path}" in out
+    assert f"only in {head_path}" in out
+    assert "REGRESSION" not in out
+
+
+def test_unsupported_format(tmp_path: Path) -> None:
+    base_path = write_report(tmp_path / "base.json", {}, version=FORMAT_VERSION + 1)
+    head_path = write_report(tmp_path / "head.json", {})
+
+    with pytest.raises(SystemExit):
+        main(["compare", base_path, head_path])
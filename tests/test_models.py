@@ -1,9 +1,27 @@
+import copy
+import pickle
+
 import pytest
 import typesystem
 
 from pyjdb import BaseModel, Boolean, Float, Integer, String
-from pyjdb.errors import FieldNotFoundError
-from pyjdb.models import _COLLECTION_KEY, _CONFIG_KEY, _FIELDS_KEY, _SCHEMA_KEY  # noqa
+from pyjdb.errors import (
+    FieldNotFoundError,
+    FieldNotLoadedError,
+    FieldSelectionTypeError,
+    FrozenFieldError,
+    IncompatibleStateError,
+    ModelTypeError,
+    ValidationError,
+)
+from pyjdb.models import (  # noqa
+    _COLLECTION_KEY,
+    _CONFIG_KEY,
+    _FIELDS_KEY,
+    _SCHEMA_KEY,
+    pack_models,
+    unpack_models,
+)
 
 
 @pytest.fixture
@@ -124,4 +142,274 @@ def test_schema(bare_model: BaseModel) -> None:
     assert isinstance(bare_model.__schema__, typesystem.Schema)
 
 
+def test_update(multi_field_model: BaseModel) -> None:
+    multi_field_model.update(s="  admin  ", i="21")
+    assert multi_field_model["s"] == "admin"
+    assert multi_field_model["i"] == 21
+
+    with pytest.raises(FieldNotFoundError):
+        multi_field_model.update(x=1)
+
+
+def test_update_is_atomic(multi_field_model: BaseModel) -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        multi_field_model.update(s="admin", i="twenty", f="nan?")
+
+    # Both invalid values are reported and none of the values is applied.
+    assert [name for name, *_ in exc_info.value.errors] == ["i", "f"]
+    assert dict(multi_field_model) == default_values
+
+
+def test_update_without_assignment_validation() -> None:
+    class Model(BaseModel, validate_assignment=False):
+        i = Integer()
+
+    model = Model(i=1)
+    model.update(i="not validated")
+    assert model["i"] == "not validated"
+
+    # 'copy' validates the updated values only if 'update' does.
+    updated = model.copy(update={"i": "not validated either"})
+    assert updated["i"] == "not validated either"
+    with pytest.raises(FieldNotFoundError):
+        model.copy(update={"x": 1})
+
+
+def test_update_frozen() -> None:
+    class Model(BaseModel, frozen=True):
+        i = Integer()
+
+    model = Model(i=1)
+    with pytest.raises(FrozenFieldError):
+        model.update(i=2)
+    assert model["i"] == 1
+
+
+def test_copy(multi_field_model: BaseModel) -> None:
+    copied = multi_field_model.copy()
+    assert copied is not multi_field_model
+    assert copied == multi_field_model
+    assert copied.__data__ is not multi_field_model.__data__
+
+    updated = multi_field_model.copy(update={"i": "21"})
+    assert updated["i"] == 21
+    assert multi_field_model["i"] == default_values["i"]
+    # Unchanged values are shared with the original model.
+    assert updated["s"] is multi_field_model["s"]
+
+    with pytest.raises(ValidationError):
+        multi_field_model.copy(update={"i": "twenty"})
+    with pytest.raises(FieldNotFoundError):
+        multi_field_model.copy(update={"x": 1})
+
+
+def test_copy_frozen() -> None:
+    class Model(BaseModel, frozen=True):
+        i = Integer()
+
+    model = Model(i=1)
+    updated = model.copy(update={"i": 2})
+    assert updated["i"] == 2
+    assert hash(updated) != hash(model)
+    assert hash(model.copy()) == hash(model)
+
+
+def test_changed_fields(multi_field_model: BaseModel) -> None:
+    assert not multi_field_model.changed_fields
+
+    multi_field_model.s = "admin"  # type: ignore
+    multi_field_model.update(i=21, f=2.0)
+    assert multi_field_model.changed_fields == {"s", "i", "f"}
+
+    multi_field_model.clear_changed_fields()
+    assert not multi_field_model.changed_fields
+
+    del multi_field_model.b  # type: ignore
+    assert multi_field_model.changed_fields == {"b"}
+    assert multi_field_model.copy(update={"i": 1}).changed_fields == {"b", "i"}
+
+
+def test_changed_fields_failed_assignment(multi_field_model: BaseModel) -> None:
+    with pytest.raises(ValidationError):
+        multi_field_model.i = "twenty"  # type: ignore
+    with pytest.raises(ValidationError):
+        multi_field_model.update(s="admin", i="twenty")
+    assert not multi_field_model.changed_fields
+
+
+# Models must be defined at module level to be picklable.
+class PicklableModel(BaseModel):
+    s = String()
+    i = Integer(nullable=True)
+
+
+class FrozenPicklableModel(BaseModel, frozen=True):
+    s = String()
+
+
+def test_pickle() -> None:
+    model = PicklableModel(s="pygrammer", i=18)
+    model.i = 21  # type: ignore
+
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        loaded = pickle.loads(pickle.dumps(model, protocol=protocol))
+        assert loaded == model
+        assert loaded.changed_fields == {"i"}
+
+    del model.i  # type: ignore
+    loaded = pickle.loads(pickle.dumps(model))
+    assert "i" not in loaded
+    assert loaded.changed_fields == {"i"}
+
+
+def test_pickle_skips_validation() -> None:
+    model = PicklableModel(s="pygrammer")
+    fingerprint = PicklableModel.__fingerprint__
+    # Only the schema fingerprint, field values and changed fields are part of the state.
+    assert model.__getstate__() == (fingerprint, ("pygrammer", None), ())
+
+    loaded = PicklableModel.__new__(PicklableModel)
+    loaded.__setstate__((fingerprint, (" not validated ", "x"), ()))
+    assert dict(loaded) == {"s": " not validated ", "i": "x"}
+
+
+def test_pickle_incompatible_state() -> None:
+    fingerprint = PicklableModel.__fingerprint__
+    loaded = PicklableModel.__new__(PicklableModel)
+
+    # State created for a model with a different set of fields.
+    with pytest.raises(IncompatibleStateError):
+        loaded.__setstate__((fingerprint, ("pygrammer",), ()))
+    with pytest.raises(IncompatibleStateError):
+        loaded.__setstate__((fingerprint, ("pygrammer", 18, True), ()))
+    with pytest.raises(IncompatibleStateError):
+        loaded.__setstate__((fingerprint + 1, ("pygrammer", 18), ()))
+
+    model, _, states = pack_models(PicklableModel, [PicklableModel(s="pygrammer")])
+    with pytest.raises(IncompatibleStateError):
+        unpack_models((model, fingerprint + 1, states))
+
+
+def test_schema_fingerprint() -> None:
+    class Model(BaseModel):
+        s = String()
+        i = Integer(nullable=True)
+
+    class Renamed(BaseModel):
+        s = String()
+        j = Integer(nullable=True)
+
+    class Retyped(BaseModel):
+        s = String()
+        i = Float(nullable=True)
+
+    assert Model.__fingerprint__ == PicklableModel.__fingerprint__
+    assert Renamed.__fingerprint__ != Model.__fingerprint__
+    assert Retyped.__fingerprint__ != Model.__fingerprint__
+
+
+def test_pickle_frozen() -> None:
+    model = FrozenPicklableModel(s="pygrammer")
+    assert hash(pickle.loads(pickle.dumps(model))) == hash(model)
+    assert hash(copy.deepcopy(model)) == hash(model)
+
+
+def test_pack_models() -> None:
+    models = [PicklableModel(s=str(i), i=i) for i in range(10)]
+    models[3].s = "changed"  # type: ignore
+
+    packed = pickle.loads(pickle.dumps(pack_models(PicklableModel, models)))
+    loaded = unpack_models(packed)
+
+    assert loaded == models
+    assert all(isinstance(m, PicklableModel) for m in loaded)
+    assert loaded[3].changed_fields == {"s"}
+    assert unpack_models(pack_models(PicklableModel, [])) == []
+
+    with pytest.raises(ModelTypeError):
+        pack_models(PicklableModel, [FrozenPicklableModel(s="pygrammer")])
+
+
+def test_partial() -> None:
+    class Model(BaseModel):
+        s = String()
+        b = Boolean()
+        i = Integer()
+        f = Float()
+
+    record = {**default_values, "s": "  admin  ", "f": "not validated"}
+
+    model = Model.partial(record, only=("i", "s"))
+    assert dict(model) == {"s": "admin", "i": 18}
+    assert model.s == "admin"
+
+    with pytest.raises(FieldNotLoadedError):
+        model.f  # noqa
+    with pytest.raises(FieldNotLoadedError):
+        model["b"]  # noqa
+    assert model.get("b") is None
+    with pytest.raises(FieldNotFoundError):
+        model["x"]  # noqa
+
+    model = Model.partial(default_values, exclude=["f"])
+    assert model.keys() == {"s", "b", "i"}
+
+    # The selected fields are still validated.
+    with pytest.raises(ValidationError):
+        Model.partial({"i": "eighteen", "f": 1.0}, only=["i"])
+    with pytest.raises(ValidationError):
+        Model.partial({}, only=["i"])
+    with pytest.raises(FieldNotFoundError):
+        Model.partial(default_values, only=["x"])
+    with pytest.raises(FieldSelectionTypeError):
+        Model.partial(default_values, only="s")
+    with pytest.raises(FieldSelectionTypeError):
+        Model.partial(default_values, exclude="s")
+
+
+def test_partial_assignment() -> None:
+    class Model(BaseModel):
+        s = String()
+        i = Integer()
+        f = Float()
+
+    model = Model.partial(default_values, only=["s"])
+
+    # Assigned fields are loaded from then on, deleting them makes them missing.
+    model.i = 21  # type: ignore
+    model.update(f="2.5")
+    assert model.i == 21
+    assert model.f == 2.5
+    assert not model.__unloaded__
+    assert model.__getstate__()[3:] == ()
+
+    del model.i  # type: ignore
+    with pytest.raises(KeyError):
+        model.i  # noqa
+    with pytest.raises(FieldNotFoundError):
+        model["i"]  # noqa
+
+    # Deleting an unloaded field makes it a regular missing field too.
+    model = Model.partial(default_values, only=["s"])
+    del model.f  # type: ignore
+    with pytest.raises(KeyError):
+        model.f  # noqa
+    assert model.changed_fields == {"f"}
+    with pytest.raises(FieldNotLoadedError):
+        model.i  # noqa
+
+
+def test_partial_copy_and_pickle() -> None:
+    model = PicklableModel.partial({"s": "pygrammer", "i": 18}, only=["s"])
+
+    loaded = pickle.loads(pickle.dumps(model))
+    assert dict(loaded) == {"s": "pygrammer"}
+    with pytest.raises(FieldNotLoadedError):
+        loaded.i  # noqa
+
+    with pytest.raises(FieldNotLoadedError):
+        model.copy().i  # noqa
+    assert model.copy(update={"i": 21}).i == 21
+
+
 # TODO: Add tests for model config and hashable models